@@ -0,0 +1,264 @@
+import argparse
+import json
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+from record_store import load_records
+
+# Award names come out of the scrapers exactly as they appear on the page, e.g.
+# "BEST OVERALL HACK:", "BEST COLLABORATION/OPEN SOURCE: Slackit" or the
+# "No Award Found" placeholder. This module maps them onto a small set of canonical
+# categories and keeps running counts (rollups) that are updated one record at a time,
+# so winner statistics are always ready to read without re-aggregating the records.
+
+# Category used for records without an award
+no_award_category = 'NO_AWARD'
+# Category used for award text we do not recognise yet (still counted, so nothing is lost)
+other_award_category = 'OTHER'
+
+# Placeholders the scrapers print when no award was found
+no_award_values = {'', 'none', 'no award found'}
+
+# Ordered (pattern, category) pairs, all checked against the award name, so combined awards
+# ("BEST COLLABORATION/OPEN SOURCE", "BEST BREAKOUT TEAM & HACKER'S CHOICE") are counted
+# under every category they name. The patterns are compiled once here instead of per record.
+award_category_patterns = [
+    (re.compile(r'\bOVERALL\b'), 'BEST_OVERALL'),
+    (re.compile(r'\bCOLLABORAT'), 'BEST_COLLABORATION'),
+    (re.compile(r'\bOPEN SOURCE\b'), 'BEST_OPEN_SOURCE'),
+    (re.compile(r'\bSUSTAINAB'), 'MOST_SUSTAINABLE'),
+    (re.compile(r'\bEXISTING APPLICATIONS?\b'), 'BEST_USE_OF_EXISTING_APPLICATIONS'),
+    (re.compile(r'\bBREAKOUT\b'), 'BEST_BREAKOUT_TEAM'),
+    (re.compile(r'\bHACKER.?S CHOICE\b'), 'HACKERS_CHOICE'),
+]
+
+# Technology keywords tracked in the rollups. Keys are the lowercase tokens that may
+# appear in a title or summary, values are the keyword the rollups are reported under.
+technology_keywords = {
+    'ai': 'AI',
+    'llm': 'LLM',
+    'llms': 'LLM',
+    'gpt': 'LLM',
+    'chatgpt': 'LLM',
+    'openai': 'LLM',
+    'rhino': 'Rhino',
+    'grasshopper': 'Grasshopper',
+    'revit': 'Revit',
+    'speckle': 'Speckle',
+    'ifc': 'IFC',
+    'bim': 'BIM',
+    'python': 'Python',
+    'unity': 'Unity',
+    'unreal': 'Unreal',
+    'blender': 'Blender',
+    'autocad': 'AutoCAD',
+    'gis': 'GIS',
+    'vr': 'VR/AR',
+    'ar': 'VR/AR',
+    'xr': 'VR/AR',
+    'web': 'Web',
+    'graph': 'Graph',
+    'database': 'Database',
+    'carbon': 'Carbon',
+    'energy': 'Energy',
+    'structural': 'Structural',
+    'zoning': 'Zoning',
+}
+
+# Every category normalize_award can return
+canonical_categories = {no_award_category, other_award_category} | {category for _, category in award_category_patterns}
+
+# Lowercase word tokenizer, shared by the keyword rollups, idea retrieval and the query service
+word_pattern = re.compile(r"[a-z0-9]+")
+
+# Event label used when a record does not carry an 'event' field
+unknown_event = 'Unknown Event'
+
+
+@lru_cache(maxsize=4096)
+def normalize_award(raw_award):
+    # Returns a tuple of canonical categories for a raw award string.
+    # Results are cached because the same handful of award strings repeat across every record.
+    if raw_award is None or raw_award.strip().lower() in no_award_values:
+        return (no_award_category,)
+
+    # Normalise typography and case, e.g. "HACKER’S" -> "HACKER'S"
+    award_text = raw_award.replace('’', "'").upper()
+    # Only keep the award name; anything after the first colon is the project name
+    # leaking in ("BEST OPEN SOURCE: Stroll (")
+    award_text = award_text.split(':', 1)[0].strip()
+
+    categories = [category for pattern, category in award_category_patterns if pattern.search(award_text)]
+
+    if not categories:
+        return (other_award_category,)
+    return tuple(categories)
+
+
+def find_technology_keywords(text):
+    # Maps the words of a text to the tracked keywords they report under, e.g. "gpt" -> "LLM"
+    found = set()
+    for word in word_pattern.findall((text or '').lower()):
+        keyword = technology_keywords.get(word)
+        if keyword:
+            found.add(keyword)
+    return found
+
+
+def extract_technology_keywords(record):
+    # Finds the tracked technology keywords mentioned in a record's title and summary
+    return find_technology_keywords(f"{record.get('title') or ''} {record.get('summary') or ''}")
+
+
+def record_key(record):
+    # Identifies a record across re-extractions, so a re-scraped project replaces its old entry.
+    # Only the project URL is used: titles are not unique, and the older scrapers print the same
+    # placeholder title for many projects, which would make them replace each other.
+    return record.get('url') or record.get('github_url') or None
+
+
+class AwardRollups:
+    # Running award statistics, updated incrementally as records stream in.
+    # Every counter is kept up to date in add(), so reads are plain dictionary lookups.
+    # Records are keyed by URL, so feeding a re-extraction replaces the earlier
+    # contribution of each project instead of counting it twice.
+
+    def __init__(self):
+        self.total_records = 0
+        self.total_winners = 0
+        # category -> number of records with that award category
+        self.category_counts = Counter()
+        # event -> category -> count
+        self.event_category_counts = defaultdict(Counter)
+        # technology keyword -> category -> count
+        self.keyword_category_counts = defaultdict(Counter)
+        # record key -> (categories, event, keywords) that record added to the counters
+        self.contributions = {}
+        self.unkeyed_count = 0
+
+    def apply(self, contribution, delta):
+        # Adds (delta=1) or takes back (delta=-1) one record's contribution to the counters
+        categories, event, keywords = contribution
+        self.total_records += delta
+        if categories != (no_award_category,):
+            self.total_winners += delta
+
+        for category in categories:
+            for counts in [self.category_counts, self.event_category_counts[event]] + \
+                    [self.keyword_category_counts[keyword] for keyword in keywords]:
+                counts[category] += delta
+                if not counts[category]:
+                    del counts[category]
+        # Drop events and keywords that no longer have any records
+        if not self.event_category_counts[event]:
+            del self.event_category_counts[event]
+        for keyword in keywords:
+            if not self.keyword_category_counts[keyword]:
+                del self.keyword_category_counts[keyword]
+
+    def add(self, record):
+        # Folds one scraped record into the rollups (replacing an earlier version of the same
+        # record, if any) and returns its canonical categories
+        categories = normalize_award(record.get('award'))
+        contribution = (categories, record.get('event') or unknown_event, tuple(sorted(extract_technology_keywords(record))))
+
+        key = record_key(record)
+        if key is None:
+            # Nothing to identify the record by; it can be counted but not replaced later
+            self.unkeyed_count += 1
+            key = ('unkeyed', self.unkeyed_count)
+        previous = self.contributions.get(key)
+        if previous is not None:
+            self.apply(previous, -1)
+        self.contributions[key] = contribution
+        self.apply(contribution, 1)
+        return categories
+
+    def remove(self, record):
+        # Takes a record back out of the rollups; returns False if it was never added
+        previous = self.contributions.pop(record_key(record), None)
+        if previous is None:
+            return False
+        self.apply(previous, -1)
+        return True
+
+    def add_many(self, records):
+        for record in records:
+            self.add(record)
+
+    # --- O(1) reads used by the idea generator ---
+
+    def category_count(self, category):
+        return self.category_counts[category]
+
+    def event_count(self, event, category):
+        return self.event_category_counts.get(event, {}).get(category, 0)
+
+    def keyword_count(self, keyword, category):
+        return self.keyword_category_counts.get(keyword, {}).get(category, 0)
+
+    def keyword_win_count(self, keyword):
+        # Number of award wins (any category) for projects mentioning the keyword
+        counts = self.keyword_category_counts.get(keyword, {})
+        return sum(count for category, count in counts.items() if category != no_award_category)
+
+    # --- Persistence, so the rollups can be shared without re-parsing the records ---
+
+    def to_dict(self):
+        # The counters are included for readability; loading rebuilds them from 'records'
+        return {
+            'total_records': self.total_records,
+            'total_winners': self.total_winners,
+            'category_counts': dict(self.category_counts),
+            'event_category_counts': {event: dict(counts) for event, counts in self.event_category_counts.items()},
+            'keyword_category_counts': {keyword: dict(counts) for keyword, counts in self.keyword_category_counts.items()},
+            'records': [[key if isinstance(key, str) else None, list(categories), event, list(keywords)]
+                        for key, (categories, event, keywords) in self.contributions.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        rollups = cls()
+        for key, categories, event, keywords in data.get('records', []):
+            contribution = (tuple(categories), event, tuple(keywords))
+            if key is None:
+                rollups.unkeyed_count += 1
+                key = ('unkeyed', rollups.unkeyed_count)
+            rollups.contributions[key] = contribution
+            rollups.apply(contribution, 1)
+        return rollups
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build award rollups from a scrape output file.')
+    parser.add_argument('input', nargs='?', default='data5.txt', help='Extraction result: .rec, .json or a data*.txt file printed by a scrape script')
+    parser.add_argument('--out', help='Optional path to save the rollups as JSON')
+    args = parser.parse_args()
+
+    rollups = AwardRollups()
+    rollups.add_many(load_records(args.input))
+
+    print(f"Processed {rollups.total_records} records, {rollups.total_winners} with an award.")
+    print("\n--- Awards per category ---")
+    for category, count in rollups.category_counts.most_common():
+        print(f"  {category}: {count}")
+    print("\n--- Awards per event ---")
+    for event, counts in sorted(rollups.event_category_counts.items()):
+        print(f"  {event}: {sum(count for category, count in counts.items() if category != no_award_category)} of {sum(counts.values())}")
+    print("\n--- Award wins per technology keyword ---")
+    for keyword in sorted(rollups.keyword_category_counts, key=rollups.keyword_win_count, reverse=True):
+        print(f"  {keyword}: {rollups.keyword_win_count(keyword)}")
+
+    if args.out:
+        rollups.save(args.out)
+        print(f"\nSaved rollups to {args.out}")
@@ -0,0 +1,333 @@
+import argparse
+import hashlib
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from award_rollups import AwardRollups, find_technology_keywords, normalize_award, no_award_category, word_pattern
+from record_store import load_records
+
+# Turns the scraped projects (title / summary / award) into fully-scoped project ideas
+# and execution plans for a given theme. For each theme the most relevant past projects
+# are retrieved and put into a prompt, prompts are sent to a pluggable model backend in
+# batches with bounded concurrency, and every response is memoized by backend, prompt format,
+# normalized theme and retrieved projects in a persistent cache, so a repeated or reworded
+# theme never pays generation cost twice.
+
+# Number of past projects included in each prompt
+default_projects_per_prompt = 5
+# Number of prompts sent to the backend in a single request
+default_batch_size = 4
+# Maximum number of backend requests in flight at the same time
+default_max_concurrency = 2
+# Maximum number of responses kept in the cache before the least recently used are evicted
+default_cache_max_entries = 1000
+# Part of every cache key; bump it whenever build_prompt changes, so old responses are not reused
+prompt_format_version = 1
+# Backend identity used for the local stub server, whose port changes on every run
+stub_backend_identity = 'stub'
+
+# Common words that should not count as a theme match
+stop_words = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into', 'is', 'it',
+    'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'with', 'your', 'you', 'we', 'our',
+    'no', 'found', 'summary', 'title',
+}
+
+
+def tokenize(text):
+    return {word for word in word_pattern.findall((text or '').lower()) if word not in stop_words}
+
+
+def normalize_theme(theme):
+    # "AI zoning" and "zoning ai" are the same theme as far as retrieval and caching go
+    words = tokenize(theme)
+    return ' '.join(sorted(words)) if words else ' '.join((theme or '').lower().split())
+
+
+def cache_key(theme, projects, backend_identity, prompt_version=prompt_format_version):
+    # Cache key for a generation: the backend (so responses of one model are never served for
+    # another), the prompt format, the normalized theme and the identities of the retrieved
+    # projects. Corpus-wide statistics in the prompt are deliberately left out, so a new record
+    # only invalidates the themes whose retrieved projects it actually changes.
+    identities = [[project.get('url') or project.get('github_url'), project.get('title')] for project in projects]
+    key_source = json.dumps([backend_identity, prompt_version, normalize_theme(theme), identities], ensure_ascii=False)
+    return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+
+class ProjectIndex:
+    # Keeps the token set of every project so retrieval does not re-tokenize the corpus per theme
+
+    def __init__(self, records):
+        self.records = [record for record in records if record.get('title')]
+        self.record_tokens = [tokenize(f"{record.get('title')} {record.get('summary')}") for record in self.records]
+
+    def retrieve(self, theme, limit=default_projects_per_prompt):
+        # Scores projects by the number of theme words they share, award winners first on ties
+        theme_tokens = tokenize(theme)
+        scored = []
+        for position, (record, tokens) in enumerate(zip(self.records, self.record_tokens)):
+            overlap = len(theme_tokens & tokens)
+            if overlap:
+                is_winner = normalize_award(record.get('award')) != (no_award_category,)
+                # position keeps the ordering stable (and the prompt, and therefore its hash)
+                scored.append((-overlap, not is_winner, position, record))
+        scored.sort(key=lambda item: item[:3])
+        return [record for _, _, _, record in scored[:limit]]
+
+
+def build_prompt(theme, projects, rollups=None):
+    # Builds the generation prompt for one theme
+    lines = [
+        f"Theme: {theme}",
+        "",
+        "Past hackathon projects for inspiration:",
+    ]
+    for i, project in enumerate(projects):
+        award = project.get('award') or 'No Award Found'
+        lines.append(f"{i+1}. {project.get('title')} ({award}): {project.get('summary') or 'No Summary Found'}")
+    if not projects:
+        lines.append("(none found)")
+
+    if rollups is not None:
+        # Winner statistics for the theme's technologies come straight from the precomputed rollups
+        # The theme's words are mapped to keywords the same way records are ("gpt" -> "LLM")
+        theme_keywords = sorted(keyword for keyword in find_technology_keywords(theme) if keyword in rollups.keyword_category_counts)
+        if theme_keywords:
+            lines.append("")
+        for keyword in theme_keywords:
+            lines.append(f"Projects mentioning {keyword} won {rollups.keyword_win_count(keyword)} awards.")
+
+    lines.extend([
+        "",
+        "Propose one new, fully-scoped project idea for this theme and an execution plan with:",
+        "- Tech stack",
+        "- Core features",
+        "- Tasks",
+        "- Pitch summary",
+    ])
+    return "\n".join(lines)
+
+
+class PromptCache:
+    # Persistent cache key -> response cache backed by SQLite, with least-recently-used eviction.
+    # SQLite keeps the cache across runs without adding a dependency.
+
+    def __init__(self, path, max_entries=default_cache_max_entries):
+        self.max_entries = max_entries
+        # The generator threads share one connection, guarded by a lock
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS generations ('
+            'cache_key TEXT PRIMARY KEY, response TEXT NOT NULL, last_used INTEGER NOT NULL)'
+        )
+        self.connection.execute('CREATE INDEX IF NOT EXISTS generations_last_used ON generations (last_used)')
+        self.connection.commit()
+        # last_used holds a use counter rather than a timestamp, so the LRU order never ties
+        self.use_counter = self.connection.execute('SELECT COALESCE(MAX(last_used), 0) FROM generations').fetchone()[0]
+
+    def get(self, key):
+        with self.lock:
+            row = self.connection.execute('SELECT response FROM generations WHERE cache_key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            # Touch the entry so it counts as recently used
+            self.use_counter += 1
+            self.connection.execute('UPDATE generations SET last_used = ? WHERE cache_key = ?', (self.use_counter, key))
+            self.connection.commit()
+            return row[0]
+
+    def put_many(self, items):
+        # items: iterable of (cache key, response)
+        with self.lock:
+            self.use_counter += 1
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO generations (cache_key, response, last_used) VALUES (?, ?, ?)',
+                [(key, response, self.use_counter) for key, response in items],
+            )
+            # Evict the least recently used entries beyond the size limit
+            self.connection.execute(
+                'DELETE FROM generations WHERE cache_key IN ('
+                'SELECT cache_key FROM generations ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+            self.connection.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM generations').fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+
+class HttpBackend:
+    # Backend for a local model server. Any object with a generate_batch(prompts) method that
+    # returns one response string per prompt can be used in its place.
+    #
+    # Request:  POST {url} {"prompts": ["...", ...]}
+    # Response: {"outputs": ["...", ...]}
+
+    def __init__(self, url, timeout=120, identity=None):
+        self.url = url
+        self.timeout = timeout
+        # What cached responses are attributed to: a model name, or the URL by default
+        self.identity = identity or url
+        # One session per backend so connections are reused between batches
+        self.session = requests.Session()
+
+    def generate_batch(self, prompts):
+        response = self.session.post(self.url, json={'prompts': prompts}, timeout=self.timeout)
+        response.raise_for_status()
+        outputs = response.json()['outputs']
+        if len(outputs) != len(prompts):
+            raise ValueError(f"Backend returned {len(outputs)} outputs for {len(prompts)} prompts")
+        return outputs
+
+
+class IdeaGenerator:
+
+    def __init__(self, records, backend, cache, rollups=None,
+                 batch_size=default_batch_size, max_concurrency=default_max_concurrency,
+                 projects_per_prompt=default_projects_per_prompt):
+        self.index = ProjectIndex(records)
+        self.backend = backend
+        self.cache = cache
+        self.rollups = rollups
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.projects_per_prompt = projects_per_prompt
+        self.backend_identity = getattr(backend, 'identity', type(backend).__name__)
+        # Counters so callers can see how much work the cache saved
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def generate(self, themes):
+        # Returns {theme: generated idea and execution plan}
+        keys = {}
+        prompts = {}
+        for theme in themes:
+            projects = self.index.retrieve(theme, self.projects_per_prompt)
+            keys[theme] = cache_key(theme, projects, self.backend_identity)
+            prompts[theme] = build_prompt(theme, projects, self.rollups)
+
+        # Resolve what we can from the cache; themes with the same key are only generated once
+        responses = {}
+        pending = {}
+        for theme, key in keys.items():
+            if key in responses or key in pending:
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                responses[key] = cached
+            else:
+                self.cache_misses += 1
+                pending[key] = prompts[theme]
+
+        # Send the remaining prompts in batches, with at most max_concurrency batches in flight
+        pending_items = list(pending.items())
+        batches = [pending_items[i:i + self.batch_size] for i in range(0, len(pending_items), self.batch_size)]
+        if batches:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                for batch, outputs in zip(batches, executor.map(self.run_batch, batches)):
+                    generated = list(zip((key for key, _ in batch), outputs))
+                    self.cache.put_many(generated)
+                    responses.update(generated)
+
+        return {theme: responses[key] for theme, key in keys.items()}
+
+    def run_batch(self, batch):
+        return self.backend.generate_batch([prompt for _, prompt in batch])
+
+
+# --- Local stub server, used for trying the pipeline without a real model ---
+
+class StubModelHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        prompts = json.loads(body)['prompts']
+        outputs = [self.server.respond(prompt) for prompt in prompts]
+        payload = json.dumps({'outputs': outputs}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Keep the console output for the generated plans
+        pass
+
+
+def stub_response(prompt):
+    # Deterministic canned plan so results are reproducible
+    theme = prompt.splitlines()[0].replace('Theme: ', '', 1)
+    return "\n".join([
+        f"Idea: {theme} assistant",
+        "Tech stack: Python, Rhino/Grasshopper, web front end",
+        "Core features: data import, analysis, visual feedback",
+        "Tasks: scope data sources, build prototype, prepare demo",
+        f"Pitch summary: A hackathon-sized tool for {theme}.",
+    ])
+
+
+def start_stub_server(port=0, respond=stub_response):
+    # Starts the stub server on a background thread and returns it; server.server_address has the real port
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubModelHandler)
+    server.respond = respond
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate project ideas and execution plans for themes.')
+    parser.add_argument('themes', nargs='+', help='Themes to generate ideas for')
+    parser.add_argument('--input', default='data5.txt', help='Extraction result: .rec, .json or a data*.txt file printed by a scrape script')
+    parser.add_argument('--rollups', help='Award rollups JSON saved by award_rollups.py')
+    parser.add_argument('--backend-url', help='Model server endpoint; a local stub server is started when omitted')
+    parser.add_argument('--backend-name', help='Model name cached responses are keyed on (defaults to the backend URL)')
+    parser.add_argument('--cache', default='idea_cache.sqlite3', help='Path of the persistent response cache')
+    parser.add_argument('--cache-max-entries', type=int, default=default_cache_max_entries)
+    parser.add_argument('--batch-size', type=int, default=default_batch_size)
+    parser.add_argument('--max-concurrency', type=int, default=default_max_concurrency)
+    args = parser.parse_args()
+
+    records = load_records(args.input)
+    if args.rollups:
+        rollups = AwardRollups.load(args.rollups)
+    else:
+        rollups = AwardRollups()
+        rollups.add_many(records)
+
+    stub_server = None
+    backend_url = args.backend_url
+    backend_identity = args.backend_name
+    if backend_url is None:
+        stub_server = start_stub_server()
+        backend_url = f"http://127.0.0.1:{stub_server.server_address[1]}/generate"
+        backend_identity = stub_backend_identity
+
+    cache = PromptCache(args.cache, max_entries=args.cache_max_entries)
+    try:
+        generator = IdeaGenerator(records, HttpBackend(backend_url, identity=backend_identity), cache, rollups,
+                                  batch_size=args.batch_size, max_concurrency=args.max_concurrency)
+        results = generator.generate(args.themes)
+        for theme, plan in results.items():
+            print(f"\n--- Theme: {theme} ---")
+            print(plan)
+            print("-" * 30)
+        print(f"\nCache hits: {generator.cache_hits}, cache misses: {generator.cache_misses}")
+
+    except requests.exceptions.RequestException as e:
+        print(f"Error calling the model backend: {e}")
+    finally:
+        cache.close()
+        if stub_server is not None:
+            stub_server.shutdown()
@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+# Load test for query_service.py. Opens a number of concurrent keep-alive connections to the
+# service on localhost, sends a mix of typical queries and reports p50 / p99 latency and
+# throughput.
+#
+#   python query_service.py &
+#   python load_test.py --clients 50 --requests 200
+
+# Query mix sent by every client; repeated queries exercise the service's LRU cache
+default_queries = [
+    '/projects',
+    '/projects?award=BEST_OVERALL',
+    '/projects?award=BEST_OPEN_SOURCE&is_github_url=true',
+    '/projects?host=github.com&limit=20',
+    '/projects?host=devpost.com',
+    '/projects?is_devpost_url=true',
+    '/search?q=rhino',
+    '/search?q=grasshopper+speckle',
+    '/search?q=ai&award=BEST_OVERALL',
+    '/search?q=carbon',
+]
+
+
+async def send_request(reader, writer, host, target):
+    writer.write(f'GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n'.encode('latin-1'))
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    content_length = 0
+    for line in head.decode('latin-1').split('\r\n')[1:]:
+        if line.lower().startswith('content-length:'):
+            content_length = int(line.split(':', 1)[1])
+    await reader.readexactly(content_length)
+    return head.split(b' ', 2)[1]
+
+
+async def run_client(host, port, request_count, queries, latencies, errors, seed):
+    # One keep-alive connection sending request_count queries back to back
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(request_count):
+            target = rng.choice(queries)
+            start = time.perf_counter()
+            status = await send_request(reader, writer, host, target)
+            latencies.append(time.perf_counter() - start)
+            if status != b'200':
+                errors.append((target, status.decode('latin-1')))
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def main(host, port, clients, request_count, queries):
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(host, port, request_count, queries, latencies, errors, seed)
+                           for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Requests: {len(latencies)} from {clients} concurrent clients in {elapsed:.2f} s "
+          f"({len(latencies) / elapsed:.0f} requests/s)")
+    print(f"Latency p50: {percentile(latencies, 0.50) * 1000:.2f} ms")
+    print(f"Latency p99: {percentile(latencies, 0.99) * 1000:.2f} ms")
+    print(f"Latency mean: {statistics.mean(latencies) * 1000:.2f} ms, max: {latencies[-1] * 1000:.2f} ms")
+    if errors:
+        print(f"Errors: {len(errors)} (first: {errors[0]})")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure query_service.py latency under concurrent clients.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--clients', type=int, default=20, help='Number of concurrent connections')
+    parser.add_argument('--requests', type=int, default=100, help='Requests sent by each client')
+    args = parser.parse_args()
+    if args.clients < 1 or args.requests < 1:
+        parser.error('--clients and --requests must be at least 1')
+
+    asyncio.run(main(args.host, args.port, args.clients, args.requests, default_queries))
@@ -0,0 +1,306 @@
+import argparse
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from award_rollups import canonical_categories, normalize_award, word_pattern
+from record_store import load_records
+
+# Long-running HTTP service over the extracted projects, so the idea generator, dashboards
+# and teammates can query the corpus instead of re-running a scrape script. The records are
+# loaded once and indexed in memory (award category, URL host, GitHub/Devpost flags and an
+# inverted word index for search); results of repeated queries come from an LRU cache.
+# When an input file changes (e.g. the refresh daemon lands a new output/aectech.rec) it is
+# reloaded in the background and the cache is cleared.
+#
+#   GET /projects?award=BEST_OVERALL&host=github.com&is_github_url=true&limit=20&offset=0
+#   GET /search?q=rhino zoning&award=...&host=...
+#   GET /stats
+#   GET /health
+#
+# Built on asyncio streams only, so it needs no web framework.
+
+default_port = 8080
+default_cache_size = 1024
+default_reload_interval = 5.0
+default_limit = 50
+max_limit = 500
+
+# Record fields returned by the service
+response_fields = ['url', 'github_url', 'is_github_url', 'is_devpost_url', 'title', 'award', 'summary', 'event', 'source']
+
+
+def url_host(url):
+    host = urlsplit(url or '').netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def query_host(host):
+    # Host filter as given by a client ("github.com", "www.GitHub.com", "https://github.com/x")
+    return url_host(host if '//' in host else f'//{host}')
+
+
+def award_category(award):
+    # Accepts canonical categories (BEST_OVERALL) as well as raw award text (BEST OVERALL HACK:).
+    # A known category with no records matches nothing rather than falling back to OTHER.
+    category = award.upper()
+    if category not in canonical_categories:
+        category = normalize_award(award)[0]
+    return category
+
+
+class CorpusIndex:
+    # Immutable snapshot of the records and their indexes. A reload builds a new one and
+    # swaps it in, so queries never see a half-built index.
+
+    def __init__(self, records):
+        self.records = []
+        self.by_category = {}
+        self.by_host = {}
+        self.by_flag = {'is_github_url': set(), 'is_devpost_url': set()}
+        self.by_word = {}
+
+        for record in records:
+            record_id = len(self.records)
+            project = {field: record.get(field) for field in response_fields if record.get(field) is not None}
+            url = record.get('url') or record.get('github_url')
+            project['categories'] = list(normalize_award(record.get('award')))
+            project['host'] = url_host(url)
+            self.records.append(project)
+
+            for category in project['categories']:
+                self.by_category.setdefault(category, set()).add(record_id)
+            self.by_host.setdefault(project['host'], set()).add(record_id)
+            for flag, record_ids in self.by_flag.items():
+                if record.get(flag):
+                    record_ids.add(record_id)
+            for word in set(word_pattern.findall(f"{record.get('title') or ''} {record.get('summary') or ''}".lower())):
+                self.by_word.setdefault(word, set()).add(record_id)
+
+    def query(self, award=None, host=None, flags=(), words=()):
+        # Returns the matching record ids in document order
+        candidate_sets = []
+        if award:
+            candidate_sets.append(self.by_category.get(award_category(award), set()))
+        if host:
+            candidate_sets.append(self.by_host.get(query_host(host), set()))
+        for flag, value in flags:
+            flagged = self.by_flag[flag]
+            candidate_sets.append(flagged if value else set(range(len(self.records))) - flagged)
+        for word in words:
+            candidate_sets.append(self.by_word.get(word, set()))
+
+        if not candidate_sets:
+            return range(len(self.records))
+        # Intersect starting from the smallest set
+        candidate_sets.sort(key=len)
+        result = set(candidate_sets[0])
+        for candidates in candidate_sets[1:]:
+            result &= candidates
+        return sorted(result)
+
+
+class LruCache:
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+class QueryService:
+
+    def __init__(self, paths, cache_size=default_cache_size, reload_interval=default_reload_interval):
+        self.paths = paths
+        self.reload_interval = reload_interval
+        self.cache = LruCache(cache_size)
+        self.index = None
+        self.modification_times = {}
+        self.reload_count = 0
+
+    # --- Loading and hot reload ---
+
+    def current_modification_times(self):
+        return {path: os.stat(path).st_mtime_ns for path in self.paths if os.path.exists(path)}
+
+    def build_index(self):
+        loaded = [load_records(path) for path in self.paths if os.path.exists(path)]
+        try:
+            return CorpusIndex(record for records in loaded for record in records)
+        finally:
+            # The index keeps plain dictionaries, so record file mappings can be released
+            for records in loaded:
+                if hasattr(records, 'close'):
+                    records.close()
+
+    def load(self):
+        self.modification_times = self.current_modification_times()
+        self.index = self.build_index()
+        self.cache.clear()
+        self.reload_count += 1
+
+    async def watch_inputs(self):
+        # Polls the input files and rebuilds the index off the event loop when one changes
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            modification_times = self.current_modification_times()
+            if modification_times == self.modification_times:
+                continue
+            try:
+                index = await loop.run_in_executor(None, self.build_index)
+            except Exception as e:
+                # Possibly caught mid-write; keep serving the old index and retry next time
+                print(f"An error occurred while reloading: {e}")
+                continue
+            self.index = index
+            self.modification_times = modification_times
+            self.cache.clear()
+            self.reload_count += 1
+            print(f"Reloaded {len(index.records)} records")
+
+    # --- Queries ---
+
+    def handle(self, target):
+        # Returns (status, body bytes) for a request target such as "/projects?award=..."
+        parts = urlsplit(target)
+        path = unquote(parts.path)
+        params = dict(parse_qsl(parts.query))
+
+        if path == '/health':
+            return 200, b'{"status": "ok"}'
+        if path == '/stats':
+            return 200, json.dumps({
+                'records': len(self.index.records),
+                'reloads': self.reload_count,
+                'cache_entries': len(self.cache.entries),
+                'cache_hits': self.cache.hits,
+                'cache_misses': self.cache.misses,
+            }).encode('utf-8')
+        if path not in ('/projects', '/search'):
+            return 404, b'{"error": "not found"}'
+
+        try:
+            limit = min(int(params.get('limit', default_limit)), max_limit)
+            offset = int(params.get('offset', 0))
+        except ValueError:
+            return 400, b'{"error": "limit and offset must be integers"}'
+        if limit < 0 or offset < 0:
+            return 400, b'{"error": "limit and offset must not be negative"}'
+
+        flags = [(flag, params[flag].lower() in ('1', 'true', 'yes')) for flag in ('is_github_url', 'is_devpost_url') if flag in params]
+        words = []
+        if path == '/search':
+            words = sorted(set(word_pattern.findall(params.get('q', '').lower())))
+            if not words:
+                return 400, b'{"error": "q is required"}'
+
+        # Keyed on the normalized query, so e.g. award=best_overall and award=BEST_OVERALL, or
+        # q=Rhino and q=rhino, share one cache entry whatever the parameter order
+        award = params.get('award')
+        host = params.get('host')
+        cache_key = (path, award_category(award) if award else None, query_host(host) if host else None,
+                     tuple(flags), tuple(words), limit, offset)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return 200, cached
+
+        record_ids = self.index.query(award=award, host=host, flags=flags, words=words)
+        body = json.dumps({
+            'total': len(record_ids),
+            'offset': offset,
+            'projects': [self.index.records[record_id] for record_id in record_ids[offset:offset + limit]],
+        }, ensure_ascii=False).encode('utf-8')
+        self.cache.put(cache_key, body)
+        return 200, body
+
+    # --- HTTP ---
+
+    async def serve_connection(self, reader, writer):
+        # Minimal HTTP/1.1 with keep-alive; only GET requests without a body are expected
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                if method != 'GET':
+                    status, body = 405, b'{"error": "method not allowed"}'
+                else:
+                    try:
+                        status, body = self.handle(target)
+                    except Exception as e:
+                        status, body = 500, json.dumps({'error': str(e)}).encode('utf-8')
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}.get(status, 'Error')
+                writer.write(
+                    f'HTTP/1.1 {status} {reason}\r\n'
+                    f'Content-Type: application/json\r\n'
+                    f'Content-Length: {len(body)}\r\n'
+                    f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode('latin-1') + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        self.load()
+        print(f"Loaded {len(self.index.records)} records; listening on http://{host}:{port}")
+        server = await asyncio.start_server(self.serve_connection, host, port)
+        watcher = asyncio.create_task(self.watch_inputs())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve queries over the extracted projects.')
+    parser.add_argument('inputs', nargs='*', default=['data5.txt'], help='Extraction results: .rec, .json or data*.txt files')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=default_port)
+    parser.add_argument('--cache-size', type=int, default=default_cache_size, help='Number of query results kept in the LRU cache')
+    parser.add_argument('--reload-interval', type=float, default=default_reload_interval, help='Seconds between input file checks')
+    args = parser.parse_args()
+
+    service = QueryService(args.inputs, cache_size=args.cache_size, reload_interval=args.reload_interval)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,258 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+
+from scrape_output import load_output
+
+# Binary result file for large extraction outputs. Loading millions of records from JSON
+# builds every dictionary up front; this format is opened through mmap instead, and a record
+# (or a single field of a record) is only decoded when it is accessed.
+#
+# Layout (all integers little-endian):
+#
+#   header        magic (8 bytes), field count (uint32), record count (uint64)
+#   field names   per field: name length (uint16), UTF-8 name
+#   offset table  record count + 1 absolute record offsets (uint64, fixed width),
+#                 so record i spans offsets[i] .. offsets[i+1] and is found by index in O(1)
+#   records       per record: field count + 1 field offsets (uint32, relative to the record start),
+#                 then each field value as a one-byte type tag followed by its payload
+
+file_magic = b'HPMREC1\x00'
+
+header_struct = struct.Struct('<8sIQ')
+name_length_struct = struct.Struct('<H')
+record_offset_struct = struct.Struct('<Q')
+field_offset_struct = struct.Struct('<I')
+
+# Value type tags
+tag_missing = 0 # The record does not have this field
+tag_none = 1
+tag_false = 2
+tag_true = 3
+tag_string = 4
+tag_json = 5 # Anything else (e.g. the paragraph lists of older scrape outputs)
+
+
+def encode_value(record, name):
+    if name not in record:
+        return bytes([tag_missing])
+    value = record[name]
+    if value is None:
+        return bytes([tag_none])
+    if value is True:
+        return bytes([tag_true])
+    if value is False:
+        return bytes([tag_false])
+    if isinstance(value, str):
+        return bytes([tag_string]) + value.encode('utf-8')
+    return bytes([tag_json]) + json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+def decode_value(data):
+    # data is one encoded field value
+    tag = data[0]
+    if tag == tag_none:
+        return None
+    if tag == tag_true:
+        return True
+    if tag == tag_false:
+        return False
+    if tag == tag_string:
+        return str(data[1:], 'utf-8')
+    if tag == tag_json:
+        return json.loads(str(data[1:], 'utf-8'))
+    raise KeyError('missing field')
+
+
+def write_records(path, records):
+    # Writes the records to path; the file is replaced atomically so open readers are not disturbed
+    records = list(records)
+    # Union of the field names, in first-seen order
+    field_names = list(dict.fromkeys(name for record in records for name in record))
+
+    header = bytearray(header_struct.pack(file_magic, len(field_names), len(records)))
+    for name in field_names:
+        encoded_name = name.encode('utf-8')
+        header += name_length_struct.pack(len(encoded_name)) + encoded_name
+
+    offset_table_size = record_offset_struct.size * (len(records) + 1)
+    field_table_size = field_offset_struct.size * (len(field_names) + 1)
+    record_offsets = []
+
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as f:
+        f.write(header)
+        # Records are streamed after a placeholder offset table, which is filled in at the end
+        f.write(bytes(offset_table_size))
+        position = len(header) + offset_table_size
+        for record in records:
+            values = [encode_value(record, name) for name in field_names]
+            field_offsets = []
+            field_position = field_table_size
+            for value in values:
+                field_offsets.append(field_position)
+                field_position += len(value)
+            field_offsets.append(field_position)
+
+            record_offsets.append(position)
+            f.write(b''.join(field_offset_struct.pack(offset) for offset in field_offsets))
+            f.write(b''.join(values))
+            position += field_position
+        record_offsets.append(position)
+
+        f.seek(len(header))
+        f.write(b''.join(record_offset_struct.pack(offset) for offset in record_offsets))
+    os.replace(temporary_path, path)
+
+
+class RecordView:
+    # Lazy, read-only view of one record. Behaves like the record dictionaries the scrape
+    # scripts build (record['title'], record.get('award')), but decodes fields on access.
+
+    __slots__ = ('record_file', 'start')
+
+    def __init__(self, record_file, start):
+        self.record_file = record_file
+        self.start = start
+
+    def field_bytes(self, field_index):
+        # Returns a copy of the encoded field, so no slice of the mapping outlives close()
+        buffer = self.record_file.buffer
+        position = self.start + field_index * field_offset_struct.size
+        begin = field_offset_struct.unpack_from(buffer, position)[0]
+        end = field_offset_struct.unpack_from(buffer, position + field_offset_struct.size)[0]
+        return bytes(buffer[self.start + begin:self.start + end])
+
+    def __getitem__(self, name):
+        field_index = self.record_file.field_indexes.get(name)
+        if field_index is None:
+            raise KeyError(name)
+        try:
+            return decode_value(self.field_bytes(field_index))
+        except KeyError:
+            raise KeyError(name)
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __contains__(self, name):
+        field_index = self.record_file.field_indexes.get(name)
+        return field_index is not None and self.field_bytes(field_index)[0] != tag_missing
+
+    def keys(self):
+        return [name for name in self.record_file.field_names if name in self]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def to_dict(self):
+        return {name: self[name] for name in self.keys()}
+
+    def __repr__(self):
+        return f'RecordView({self.to_dict()!r})'
+
+
+class RecordFile:
+    # Opens a file written by write_records. Only the header is read up front.
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self.map)
+
+        magic, field_count, self.record_count = header_struct.unpack_from(self.buffer, 0)
+        if magic != file_magic:
+            self.close()
+            raise ValueError(f"{path} is not a record file")
+
+        position = header_struct.size
+        self.field_names = []
+        for _ in range(field_count):
+            name_length = name_length_struct.unpack_from(self.buffer, position)[0]
+            position += name_length_struct.size
+            self.field_names.append(str(self.buffer[position:position + name_length], 'utf-8'))
+            position += name_length
+        self.field_indexes = {name: i for i, name in enumerate(self.field_names)}
+        self.offset_table_start = position
+
+    def __len__(self):
+        return self.record_count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.record_count
+        if not 0 <= index < self.record_count:
+            raise IndexError('record index out of range')
+        start = record_offset_struct.unpack_from(self.buffer, self.offset_table_start + index * record_offset_struct.size)[0]
+        return RecordView(self, start)
+
+    def __iter__(self):
+        for index in range(self.record_count):
+            yield self[index]
+
+    def field_values(self, name):
+        # Iterates a single field across all records, decoding nothing else
+        for record in self:
+            yield record.get(name)
+
+    def filter(self, name, value=True):
+        # Iterates the records whose field equals value, e.g. filter('is_github_url')
+        for record in self:
+            if record.get(name) == value:
+                yield record
+
+    def close(self):
+        # Views handed out earlier must not be used after closing
+        try:
+            self.buffer.release()
+            self.map.close()
+        finally:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_records(path):
+    # Loads records from any of the result formats: a record file (lazy views),
+    # a JSON list of records, or a data*.txt file printed by a scrape script
+    if path.endswith('.rec'):
+        return RecordFile(path)
+    if path.endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return load_output(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convert extraction results to a record file, or read one.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert_parser = subparsers.add_parser('convert', help='Write a .rec file from a .json or data*.txt result')
+    convert_parser.add_argument('input')
+    convert_parser.add_argument('output')
+
+    titles_parser = subparsers.add_parser('titles', help='Print the titles in a .rec file')
+    titles_parser.add_argument('input')
+    titles_parser.add_argument('--github-only', action='store_true', help='Only records with is_github_url set')
+
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        records = load_records(args.input)
+        write_records(args.output, records)
+        print(f"Wrote {len(records)} records to {args.output}")
+
+    elif args.command == 'titles':
+        with RecordFile(args.input) as record_file:
+            records = record_file.filter('is_github_url') if args.github_only else record_file
+            for record in records:
+                print(record.get('title', 'No Title Found'))
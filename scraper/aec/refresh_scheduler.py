@@ -0,0 +1,357 @@
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from bs4 import BeautifulSoup
+
+from record_store import write_records
+from spec_scrape import SpecMatcher, default_specs_directory, load_specs
+
+# Long-running refresh daemon. Instead of scraping every source on a fixed cron, each URL
+# gets its own polling interval that adapts to how often its content actually changes:
+# pages that keep changing are polled more often, static pages (like the hackathon archive
+# between events) back off. Due URLs are kept in a priority queue ordered by next poll time,
+# and a global fetch budget caps the total load across all sources.
+#
+# Changes are detected on the extracted records rather than the raw page bytes, so markup
+# churn that does not affect any record (tracking scripts, build ids) does not count as a
+# change. The first fetch of a URL only sets the baseline.
+
+# Bounds and starting point for each URL's polling interval, in seconds
+default_min_interval = 15 * 60
+default_max_interval = 7 * 24 * 60 * 60
+default_initial_interval = 6 * 60 * 60
+# Interval multiplier applied after a poll that found no change
+backoff_factor = 1.5
+# Weight of the newest observation in the moving average of time between changes
+change_interval_smoothing = 0.3
+# After a change, poll about this many times per expected change interval
+polls_per_change_interval = 2
+# Global fetch budget across all URLs
+default_max_fetches_per_hour = 60
+
+
+class SourceState:
+    # What the scheduler has learned about one URL
+
+    def __init__(self, url, interval):
+        self.url = url
+        self.interval = interval
+        self.next_due = time.time()
+        self.last_checked = None
+        self.last_changed = None
+        self.content_hash = None
+        # Validators for conditional requests, so unchanged pages can answer 304 Not Modified
+        self.etag = None
+        self.last_modified = None
+        # Moving average of the seconds between observed changes (None until two changes were seen)
+        self.average_change_interval = None
+        self.fetch_count = 0
+        self.change_count = 0
+        self.error_count = 0
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data):
+        state = cls(data['url'], data['interval'])
+        state.__dict__.update(data)
+        return state
+
+
+class FetchBudget:
+    # Token bucket: holds up to max_per_hour fetches and refills continuously
+
+    def __init__(self, max_per_hour):
+        if max_per_hour <= 0:
+            raise ValueError(f"max_per_hour must be greater than 0, got {max_per_hour}")
+        self.capacity = max_per_hour
+        self.tokens = float(max_per_hour)
+        self.refill_per_second = max_per_hour / 3600.0
+        self.updated = time.time()
+
+    def refill(self):
+        now = time.time()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def seconds_until_available(self):
+        self.refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.refill_per_second
+
+    def take(self):
+        self.refill()
+        self.tokens -= 1
+
+
+def hash_extraction(extracted):
+    # Hash of raw page bytes, or of JSON-serializable extraction results
+    if not isinstance(extracted, bytes):
+        extracted = json.dumps(extracted, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(extracted).hexdigest()
+
+
+class RefreshScheduler:
+
+    def __init__(self, urls, on_change, max_fetches_per_hour=default_max_fetches_per_hour,
+                 min_interval=default_min_interval, max_interval=default_max_interval,
+                 initial_interval=default_initial_interval, state_path=None, extract=None):
+        # extract(url, content) turns a fetched page into its records; without it the raw
+        # content is compared. on_change(url, extracted) is called on the first fetch and
+        # whenever the extracted result changes; the new hash and validators are only kept
+        # once it returns, so a failed on_change is retried on the next poll.
+        self.on_change = on_change
+        self.extract = extract
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.budget = FetchBudget(max_fetches_per_hour)
+        self.state_path = state_path
+        self.session = requests.Session()
+        # The monitoring server reads the queue from another thread
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+        saved_states = self.load_states()
+        self.sources = {}
+        for url in urls:
+            self.sources[url] = saved_states.get(url) or SourceState(url, initial_interval)
+
+        # Priority queue of (next poll time, url)
+        self.queue = [(state.next_due, url) for url, state in self.sources.items()]
+        heapq.heapify(self.queue)
+
+    # --- Learned state persistence, so a restart does not forget the change rates ---
+
+    def load_states(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, encoding='utf-8') as f:
+            return {data['url']: SourceState.from_dict(data) for data in json.load(f)}
+
+    def save_states(self):
+        if not self.state_path:
+            return
+        with self.lock:
+            data = [state.to_dict() for state in self.sources.values()]
+        temporary_path = self.state_path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(temporary_path, self.state_path)
+
+    def forget(self, url):
+        # Drops what is known about a URL's content, so its next poll fetches and
+        # re-extracts it even if the server would report it unchanged
+        with self.lock:
+            state = self.sources[url]
+            state.content_hash = None
+            state.etag = None
+            state.last_modified = None
+
+    # --- Monitoring ---
+
+    def queue_state(self):
+        # Snapshot of the queue in poll order, for the status endpoint
+        with self.lock:
+            snapshot = []
+            for next_due, url in sorted(self.queue):
+                state = self.sources[url]
+                snapshot.append({
+                    'url': url,
+                    'next_due_in_seconds': round(next_due - time.time(), 1),
+                    'interval_seconds': round(state.interval, 1),
+                    'average_change_interval_seconds': state.average_change_interval,
+                    'last_checked': state.last_checked,
+                    'last_changed': state.last_changed,
+                    'fetch_count': state.fetch_count,
+                    'change_count': state.change_count,
+                    'error_count': state.error_count,
+                })
+            return {
+                'budget_tokens': round(self.budget.tokens, 2),
+                'budget_per_hour': self.budget.capacity,
+                'sources': snapshot,
+            }
+
+    # --- Scheduling ---
+
+    def fetch(self, state):
+        # Returns (content, etag, last_modified); content is None if the server reports it unchanged
+        headers = {}
+        if state.etag:
+            headers['If-None-Match'] = state.etag
+        if state.last_modified:
+            headers['If-Modified-Since'] = state.last_modified
+        response = self.session.get(state.url, headers=headers, timeout=60)
+        if response.status_code == 304:
+            return None, state.etag, state.last_modified
+        response.raise_for_status()
+        return response.content, response.headers.get('ETag'), response.headers.get('Last-Modified')
+
+    def poll(self, state):
+        # Fetches one URL, records whether it changed and adapts its polling interval
+        now = time.time()
+        state.fetch_count += 1
+        state.last_checked = now
+        content, etag, last_modified = self.fetch(state)
+
+        content_hash = state.content_hash
+        if content is not None:
+            extracted = self.extract(state.url, content) if self.extract else content
+            content_hash = hash_extraction(extracted)
+        is_baseline = state.content_hash is None
+        changed = content_hash != state.content_hash
+
+        if changed:
+            # Raises before anything is committed, so the next poll sees the change again
+            self.on_change(state.url, extracted)
+        state.content_hash = content_hash
+        state.etag = etag
+        state.last_modified = last_modified
+
+        if is_baseline:
+            # First fetch: nothing to compare against yet, keep the interval
+            return
+        if changed:
+            if state.last_changed is not None:
+                observed_interval = now - state.last_changed
+                if state.average_change_interval is None:
+                    state.average_change_interval = observed_interval
+                else:
+                    state.average_change_interval = (change_interval_smoothing * observed_interval +
+                                                     (1 - change_interval_smoothing) * state.average_change_interval)
+                state.interval = state.average_change_interval / polls_per_change_interval
+            else:
+                # First change seen since we started tracking: poll sooner than before
+                state.interval = state.interval / polls_per_change_interval
+            state.last_changed = now
+            state.change_count += 1
+        else:
+            state.interval = state.interval * backoff_factor
+        state.interval = min(self.max_interval, max(self.min_interval, state.interval))
+
+    def run(self):
+        # Main daemon loop; returns when stop() is called or there is nothing to poll
+        while self.queue and not self.stop_event.is_set():
+            with self.lock:
+                next_due, url = self.queue[0]
+            wait_seconds = max(next_due - time.time(), self.budget.seconds_until_available())
+            if wait_seconds > 0:
+                self.stop_event.wait(wait_seconds)
+                continue
+
+            with self.lock:
+                heapq.heappop(self.queue)
+            state = self.sources[url]
+            self.budget.take()
+            try:
+                self.poll(state)
+            except requests.exceptions.RequestException as e:
+                state.error_count += 1
+                print(f"Error fetching {url}: {e}")
+            except Exception as e:
+                state.error_count += 1
+                print(f"An error occurred while processing {url}: {e}")
+
+            state.next_due = time.time() + state.interval
+            with self.lock:
+                heapq.heappush(self.queue, (state.next_due, url))
+            self.save_states()
+
+    def stop(self):
+        self.stop_event.set()
+
+
+def start_status_server(scheduler, port):
+    # Serves the scheduler's queue state as JSON at /status
+    class StatusHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path != '/status':
+                self.send_error(404)
+                return
+            payload = json.dumps(scheduler.queue_state(), indent=2).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), StatusHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def write_extraction(output_directory, spec_name, records):
+    # Writes <spec>.json and the lazily readable <spec>.rec (see record_store.py).
+    # Both are written to a temporary file first so readers never see a partial file.
+    write_records(os.path.join(output_directory, f'{spec_name}.rec'), records)
+    path = os.path.join(output_directory, f'{spec_name}.json')
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+    os.replace(temporary_path, path)
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Poll registered sources adaptively and re-extract them when they change.')
+    parser.add_argument('--specs', default=default_specs_directory, help='Directory of spec JSON files')
+    parser.add_argument('--output', default='output', help='Directory the extracted records are written to')
+    parser.add_argument('--state', default='refresh_state.json', help='File the learned per-URL state is kept in')
+    parser.add_argument('--max-fetches-per-hour', type=float, default=default_max_fetches_per_hour)
+    parser.add_argument('--min-interval', type=float, default=default_min_interval)
+    parser.add_argument('--max-interval', type=float, default=default_max_interval)
+    parser.add_argument('--status-port', type=int, help='Serve the queue state at http://127.0.0.1:PORT/status')
+    args = parser.parse_args()
+    if args.max_fetches_per_hour <= 0:
+        parser.error('--max-fetches-per-hour must be greater than 0')
+
+    matcher = SpecMatcher(load_specs(args.specs))
+    os.makedirs(args.output, exist_ok=True)
+
+    def extract_page(url, content):
+        return matcher.extract(BeautifulSoup(content, 'html.parser'), url)
+
+    def write_changed_page(url, extracted):
+        for spec_name, records in extracted.items():
+            path = write_extraction(args.output, spec_name, records)
+            print(f"{url} changed: wrote {len(records)} records to {path}")
+
+    urls = []
+    for spec in matcher.specs:
+        if spec.url and spec.url not in urls:
+            urls.append(spec.url)
+    if not urls:
+        print("No spec has a url to poll.")
+
+    scheduler = RefreshScheduler(urls, write_changed_page,
+                                 max_fetches_per_hour=args.max_fetches_per_hour,
+                                 min_interval=args.min_interval, max_interval=args.max_interval,
+                                 state_path=args.state, extract=extract_page)
+    # Re-extract on startup any URL whose output files are missing (e.g. a new --output directory),
+    # even though the saved state says it has not changed
+    for spec in matcher.specs:
+        output_paths = [os.path.join(args.output, f'{spec.name}{extension}') for extension in ('.rec', '.json')]
+        if spec.url and not all(os.path.exists(path) for path in output_paths):
+            scheduler.forget(spec.url)
+    if args.status_port:
+        start_status_server(scheduler, args.status_port)
+        print(f"Queue state at http://127.0.0.1:{args.status_port}/status")
+
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        scheduler.stop()
+        scheduler.save_states()
@@ -0,0 +1,242 @@
+import argparse
+import contextlib
+import difflib
+import io
+import json
+import os
+import re
+import runpy
+import sys
+import time
+import tracemalloc
+
+import requests
+
+from scrape_output import parse_output
+
+# Differential regression check for the scrape strategies. Every script is run offline
+# against frozen HTML fixtures (requests.get is pointed at the saved pages), its printed
+# output is parsed back into records and diffed against the golden output for that script,
+# field by field. Timing and peak memory are recorded next to the accuracy numbers, so a
+# faster extractor comes with proof that it still produces the same results.
+#
+# The committed fixture in fixtures/ is rebuilt from data5.txt (the live page has changed
+# since), so scrape5.py and spec_scrape.py are checked against data5.txt itself. The older
+# scripts were written for earlier versions of the page, so their data*.txt files cannot be
+# reproduced from it; their goldens in golden/ are baselined from the fixture instead.
+#
+#   --freeze          download the live pages into the fixtures directory
+#   --update-golden   re-baseline the goldens from the frozen pages (after a --freeze, or
+#                     after an intended output change), then review the diff before committing
+
+script_directory = os.path.dirname(os.path.abspath(__file__))
+default_fixtures_directory = os.path.join(script_directory, 'fixtures')
+
+# (strategy name, script, arguments, golden output)
+strategies = [
+    ('scrape_old', 'scrape_old.py', [], 'golden/scrape_old.txt'),
+    ('scrape1', 'scrape1.py', [], 'golden/scrape1.txt'),
+    ('scrape2', 'scrape2.py', [], 'golden/scrape2.txt'),
+    ('scrape3', 'scrape3.py', [], 'golden/scrape3.txt'),
+    ('scrape4', 'scrape4.py', [], 'golden/scrape4.txt'),
+    ('scrape5', 'scrape5.py', [], 'data5.txt'),
+    ('spec_scrape', 'spec_scrape.py', ['--site', 'aectech'], 'data5.txt'),
+]
+
+# Pages the strategies fetch; these are the pages saved by --freeze
+fixture_urls = ['https://www.aectech.us/hackathon-archive']
+
+# Fields compared between a strategy's records and the golden records
+compared_fields = ['url', 'github_url', 'is_github_url', 'is_devpost_url', 'title', 'award', 'summary', 'paragraphs']
+
+# Characters not allowed in fixture file names
+unsafe_file_name_characters = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+def fixture_path(fixtures_directory, url):
+    # e.g. https://www.aectech.us/hackathon-archive -> www.aectech.us_hackathon-archive.html
+    name = unsafe_file_name_characters.sub('_', re.sub(r'^https?://', '', url)).strip('_')
+    return os.path.join(fixtures_directory, f'{name}.html')
+
+
+def freeze_fixtures(fixtures_directory):
+    os.makedirs(fixtures_directory, exist_ok=True)
+    for url in fixture_urls:
+        response = requests.get(url)
+        response.raise_for_status()
+        path = fixture_path(fixtures_directory, url)
+        with open(path, 'wb') as f:
+            f.write(response.content)
+        print(f"Saved {url} to {path}")
+
+
+class FixtureResponse:
+    # The parts of requests.Response the scrape scripts use
+
+    def __init__(self, url, content):
+        self.url = url
+        self.content = content
+        self.status_code = 200
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+@contextlib.contextmanager
+def offline_requests(fixtures_directory):
+    # Serves every requests.get from the fixtures directory while the block runs
+    def fixture_get(url, *args, **kwargs):
+        path = fixture_path(fixtures_directory, url)
+        if not os.path.exists(path):
+            raise requests.exceptions.ConnectionError(f"No frozen fixture for {url} (expected {path})")
+        with open(path, 'rb') as f:
+            return FixtureResponse(url, f.read())
+
+    original_get = requests.get
+    requests.get = fixture_get
+    try:
+        yield
+    finally:
+        requests.get = original_get
+
+
+def run_strategy(script, arguments, fixtures_directory):
+    # Runs a scrape script as __main__ and returns what it printed
+    output = io.StringIO()
+    original_argv = sys.argv
+    sys.argv = [script] + arguments
+    try:
+        with offline_requests(fixtures_directory), contextlib.redirect_stdout(output):
+            runpy.run_path(os.path.join(script_directory, script), run_name='__main__')
+    finally:
+        sys.argv = original_argv
+    return output.getvalue()
+
+
+def measure_strategy(script, arguments, fixtures_directory, repeat):
+    # Best wall time over `repeat` runs, then one extra run under tracemalloc for peak memory
+    best_seconds = None
+    output = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = run_strategy(script, arguments, fixtures_directory)
+        elapsed = time.perf_counter() - start
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+
+    tracemalloc.start()
+    try:
+        run_strategy(script, arguments, fixtures_directory)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return output, best_seconds, peak_bytes
+
+
+def record_identity(record):
+    # What makes two records "the same project" when aligning the outputs. The title is only
+    # used when there is no URL, so a changed title shows up as a field-level mismatch.
+    return record.get('url') or record.get('github_url') or record.get('title')
+
+
+def diff_records(actual_records, golden_records):
+    # Aligns the two record lists and returns a list of human-readable differences
+    differences = []
+    matcher = difflib.SequenceMatcher(a=[record_identity(r) for r in golden_records],
+                                      b=[record_identity(r) for r in actual_records],
+                                      autojunk=False)
+    for operation, golden_start, golden_end, actual_start, actual_end in matcher.get_opcodes():
+        # Records in 'equal' and 'replace' blocks are compared field by field, pairing them up in
+        # order; whatever is left over on either side is reported as missing or extra
+        paired = 0
+        if operation in ('equal', 'replace'):
+            paired = min(golden_end - golden_start, actual_end - actual_start)
+        for offset in range(paired):
+            golden_index, actual_index = golden_start + offset, actual_start + offset
+            golden, actual = golden_records[golden_index], actual_records[actual_index]
+            for field in compared_fields:
+                if golden.get(field) != actual.get(field):
+                    differences.append(f"record {golden_index+1} {field}: expected {golden.get(field)!r}, got {actual.get(field)!r}")
+        for golden_index in range(golden_start + paired, golden_end):
+            differences.append(f"missing record {golden_index+1}: {record_identity(golden_records[golden_index])!r}")
+        for actual_index in range(actual_start + paired, actual_end):
+            differences.append(f"extra record {actual_index+1}: {record_identity(actual_records[actual_index])!r}")
+    return differences
+
+
+def update_golden(script, arguments, golden_file, fixtures_directory):
+    # Replaces the golden output with what the script prints for the frozen pages
+    output = run_strategy(script, arguments, fixtures_directory)
+    if not parse_output(output):
+        raise ValueError(f"{script} printed no records, not updating {golden_file}: {output.strip()[:200]!r}")
+    path = os.path.join(script_directory, golden_file)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(output)
+    return path
+
+
+def check_strategy(name, script, arguments, golden_file, fixtures_directory, repeat):
+    output, seconds, peak_bytes = measure_strategy(script, arguments, fixtures_directory, repeat)
+    actual_records = parse_output(output)
+    with open(os.path.join(script_directory, golden_file), encoding='utf-8') as f:
+        golden_records = parse_output(f.read())
+    differences = diff_records(actual_records, golden_records)
+    if not actual_records:
+        # The scripts print errors instead of raising, so surface what they said
+        differences.insert(0, f"no records parsed; script output: {output.strip()[:200]!r}")
+    return {
+        'strategy': name,
+        'golden': golden_file,
+        'records': len(actual_records),
+        'golden_records': len(golden_records),
+        'differences': differences,
+        'seconds': seconds,
+        'peak_memory_bytes': peak_bytes,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Diff each scrape strategy against its golden output, offline.')
+    parser.add_argument('--fixtures', default=default_fixtures_directory, help='Directory of frozen HTML pages')
+    parser.add_argument('--freeze', action='store_true', help='Download the live pages into the fixtures directory and exit')
+    parser.add_argument('--update-golden', action='store_true', help='Rewrite the golden outputs from the frozen pages and exit')
+    parser.add_argument('--strategy', action='append', help='Only run the named strategy (can be repeated)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per strategy; the best time is reported')
+    parser.add_argument('--max-differences', type=int, default=10, help='Differences printed per strategy')
+    parser.add_argument('--json', help='Also write the full results to this JSON file')
+    args = parser.parse_args()
+
+    if args.freeze:
+        freeze_fixtures(args.fixtures)
+        sys.exit(0)
+
+    if args.update_golden:
+        for name, script, arguments, golden_file in strategies:
+            if args.strategy and name not in args.strategy:
+                continue
+            path = update_golden(script, arguments, golden_file, args.fixtures)
+            print(f"{name:<12} wrote {path}")
+        sys.exit(0)
+
+    results = []
+    for name, script, arguments, golden_file in strategies:
+        if args.strategy and name not in args.strategy:
+            continue
+        result = check_strategy(name, script, arguments, golden_file, args.fixtures, args.repeat)
+        results.append(result)
+
+        status = 'OK' if not result['differences'] else f"{len(result['differences'])} DIFFERENCES"
+        print(f"{name:<12} vs {golden_file:<22} {status:<16} "
+              f"records {result['records']}/{result['golden_records']}  "
+              f"time {result['seconds'] * 1000:.1f} ms  peak memory {result['peak_memory_bytes'] / 1024:.0f} KiB")
+        for difference in result['differences'][:args.max_differences]:
+            print(f"  {difference}")
+        if len(result['differences']) > args.max_differences:
+            print(f"  ... {len(result['differences']) - args.max_differences} more")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    sys.exit(1 if any(result['differences'] for result in results) else 0)
@@ -0,0 +1,76 @@
+import re
+
+# Parses the text printed by scrape_old.py / scrape1.py - scrape5.py (the data*.txt files)
+# back into the same list of dictionaries the scripts built before printing them.
+# This lets later steps (analytics, idea generation, regression checks) consume the
+# existing outputs without re-running a scrape.
+
+# Header line that starts a new record, e.g. "--- Project Group 3 ---" or "--- Project 3 ---"
+record_header_pattern = re.compile(r'^--- Project(?: Group)? (\d+) ---$')
+# Indented paragraph line, e.g. "  Paragraph 2: some text"
+paragraph_pattern = re.compile(r'^  Paragraph (\d+): ?(.*)$')
+# Regular "Label: value" line
+field_pattern = re.compile(r'^([A-Za-z ]+): ?(.*)$')
+
+# Maps the printed labels to the dictionary keys used by the scrape scripts
+label_to_key = {
+    'GitHub URL': 'github_url',
+    'URL': 'url',
+    'Is GitHub URL': 'is_github_url',
+    'Is Devpost URL': 'is_devpost_url',
+    'Title': 'title',
+    'Award': 'award',
+    'Summary': 'summary',
+}
+
+# Labels whose printed value is a Python bool
+boolean_keys = {'is_github_url', 'is_devpost_url'}
+
+# The separator printed after every record
+record_separator = '-' * 30
+
+
+def convert_value(key, value):
+    # Undo the str() conversion that print() applied to non-string values
+    if key in boolean_keys:
+        return value == 'True'
+    if value == 'None':
+        return None
+    return value
+
+
+def parse_output(text):
+    # Returns the records in the order they were printed
+    records = []
+    current_record = None
+
+    for line in text.splitlines():
+        header_match = record_header_pattern.match(line)
+        if header_match:
+            # A new record starts; the previous one (if any) is already in the list
+            current_record = {}
+            records.append(current_record)
+            continue
+
+        if current_record is None or line == record_separator or not line:
+            # Lines before the first record ("Found N ...") and separators carry no data
+            continue
+
+        paragraph_match = paragraph_pattern.match(line)
+        if paragraph_match:
+            current_record.setdefault('paragraphs', []).append(paragraph_match.group(2))
+            continue
+
+        field_match = field_pattern.match(line)
+        if field_match and field_match.group(1) in label_to_key:
+            key = label_to_key[field_match.group(1)]
+            current_record[key] = convert_value(key, field_match.group(2))
+        # "Paragraphs in this group (N):" style lines only repeat len(paragraphs), so they are skipped
+
+    return records
+
+
+def load_output(path):
+    # Convenience wrapper to parse a data*.txt file from disk
+    with open(path, encoding='utf-8') as f:
+        return parse_output(f.read())
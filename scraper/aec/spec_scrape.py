@@ -0,0 +1,333 @@
+import argparse
+import json
+import os
+import re
+
+import requests
+from bs4 import BeautifulSoup
+from bs4.element import Tag # Import Tag for type checking
+
+# Declarative version of scrape5.py. Instead of a new script per layout, every source is
+# described by a JSON spec in the specs/ directory (see specs/aectech.json):
+#
+#   target  - which elements hold a project, e.g. <p style="white-space:pre-wrap;">
+#   link    - the anchor inside the target that carries the project URL, and the URL
+#             patterns that make a target a project entry (github, devpost, ...)
+#   fields  - how to read each field:
+#               {"tag": "strong", "within": "link"}       first <strong> inside the link ("link" is the only reference)
+#               {"tag": "strong", "not_within": "link"}   first <strong> outside the link
+#               {"distinct_from": "title"}                skip elements equal to another field
+#               {"from": "next_sibling"}                  text of the next target sibling
+#               {"from": "previous_heading", "tags": [...]}  text of the last such heading before the target
+#               {"reject_if_contains": [...]}             fall back to the default if the text contains any of these
+#               {"default": "..."}                        value used when nothing matched
+#
+# All specs are compiled and validated once (regexes included) into a SpecMatcher, which walks
+# the parsed page a single time; targets, links, field candidates and next siblings are all
+# collected during that walk, for every registered spec at once.
+
+# Directory holding the spec files, next to this script
+default_specs_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'specs')
+
+
+def load_specs(directory=default_specs_directory):
+    # Loads every *.json spec in the directory, in file name order
+    specs = []
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.endswith('.json'):
+            with open(os.path.join(directory, file_name), encoding='utf-8') as f:
+                specs.append(json.load(f))
+    return specs
+
+
+# Keys a field rule may use
+tag_rule_keys = {'tag', 'within', 'not_within', 'distinct_from', 'reject_if_contains', 'default'}
+sibling_rule_keys = {'from', 'reject_if_contains', 'default'}
+heading_rule_keys = {'from', 'tags', 'reject_if_contains', 'default'}
+# Elements a within / not_within rule can refer to
+rule_references = {'link'}
+
+
+class CompiledSpec:
+    # One spec with everything that can be prepared ahead of the walk already prepared
+
+    def __init__(self, spec):
+        self.name = spec['name']
+        self.url = spec.get('url')
+        # Pages this spec applies to; a spec without match_url applies to every page
+        self.match_url = re.compile(spec['match_url'], re.IGNORECASE) if spec.get('match_url') else None
+
+        self.target_tag = spec['target']['tag']
+        self.target_style = spec['target'].get('style')
+
+        self.link_tag = spec['link']['tag']
+        # (type name, compiled pattern, printed label), checked in spec order
+        self.url_types = []
+        for type_name, url_type in spec['link']['url_types'].items():
+            self.url_types.append((type_name, re.compile(url_type['pattern'], re.IGNORECASE), url_type.get('label', type_name)))
+
+        self.fields = list(spec['fields'].items())
+        self.validate_fields()
+        # Tags the walk has to collect inside a target for the tag rules
+        self.field_tags = {rule['tag'] for _, rule in self.fields if 'tag' in rule}
+        # heading tag -> fields reading the last heading of that tag before a target
+        self.heading_fields = {}
+        for field_name, rule in self.fields:
+            if rule.get('from') == 'previous_heading':
+                for tag in rule['tags']:
+                    self.heading_fields.setdefault(tag, []).append(field_name)
+
+    def validate_fields(self):
+        # Catches typos in spec files up front instead of silently extracting the wrong thing
+        tag_fields = set()
+        for field_name, rule in self.fields:
+            where = f"spec {self.name!r}, field {field_name!r}"
+            if 'tag' in rule:
+                unknown_keys = set(rule) - tag_rule_keys
+                if 'within' in rule and 'not_within' in rule:
+                    raise ValueError(f"{where}: use either 'within' or 'not_within', not both")
+                for key in ('within', 'not_within'):
+                    if key in rule and rule[key] not in rule_references:
+                        raise ValueError(f"{where}: {key!r} must be one of {sorted(rule_references)}, got {rule[key]!r}")
+                if 'distinct_from' in rule and rule['distinct_from'] not in tag_fields:
+                    raise ValueError(f"{where}: 'distinct_from' must name an earlier tag field, got {rule['distinct_from']!r}")
+                tag_fields.add(field_name)
+            elif rule.get('from') == 'next_sibling':
+                unknown_keys = set(rule) - sibling_rule_keys
+            elif rule.get('from') == 'previous_heading':
+                if not rule.get('tags') or not isinstance(rule['tags'], list):
+                    raise ValueError(f"{where}: 'previous_heading' needs a non-empty 'tags' list")
+                unknown_keys = set(rule) - heading_rule_keys
+            else:
+                raise ValueError(f"{where}: needs a 'tag' or a 'from' of next_sibling or previous_heading")
+            if unknown_keys:
+                raise ValueError(f"{where}: unknown keys {sorted(unknown_keys)}")
+
+    def applies_to(self, url):
+        return url is None or self.match_url is None or self.match_url.search(url) is not None
+
+    def is_target(self, element):
+        return element.name == self.target_tag and \
+            (self.target_style is None or element.get('style') == self.target_style)
+
+    def apply_rejections(self, rule, value):
+        if value is not None and any(text in value for text in rule.get('reject_if_contains', [])):
+            value = None
+        return value if value is not None else rule.get('default')
+
+
+class TargetState:
+    # What the walk has seen so far inside one open target element
+
+    def __init__(self, spec, element, slot, headings):
+        self.spec = spec
+        self.element = element
+        # field name -> text of the last matching heading before the target
+        self.headings = headings
+        # Position of this target's record in the results, so records stay in document order
+        self.slot = slot
+        # First link element inside the target (the one carrying the project URL)
+        self.link = None
+        # Link elements currently open around the walk position, innermost last
+        self.open_links = []
+        # tag name -> [(element, innermost enclosing link or None)] in document order
+        self.candidates = {tag: [] for tag in spec.field_tags}
+
+    def enter(self, element):
+        if element.name in self.candidates:
+            enclosing_link = self.open_links[-1] if self.open_links else None
+            self.candidates[element.name].append((element, enclosing_link))
+        if element.name == self.spec.link_tag:
+            if self.link is None:
+                self.link = element
+            self.open_links.append(element)
+
+    def exit(self, element):
+        if self.open_links and self.open_links[-1] is element:
+            self.open_links.pop()
+
+    def finish(self):
+        # Returns (record or None, [(field name, rule)] still waiting for the next sibling)
+        spec = self.spec
+        link = self.link
+        if link is None:
+            return None, []
+        href = link.get('href')
+        if not href:
+            return None, []
+
+        url_type = None
+        for type_name, pattern, _ in spec.url_types:
+            if pattern.search(href):
+                url_type = type_name
+                break
+        if url_type is None:
+            return None, []
+
+        record = {'url': href}
+        for type_name, _, _ in spec.url_types:
+            record[f'is_{type_name}_url'] = type_name == url_type
+
+        # Elements chosen for each field, so later fields can refer to earlier ones (distinct_from)
+        chosen_elements = {}
+        waiting_fields = []
+        for field_name, rule in spec.fields:
+            if rule.get('from') == 'previous_heading':
+                record[field_name] = spec.apply_rejections(rule, self.headings.get(field_name))
+                continue
+            if 'tag' not in rule:
+                # next_sibling: filled in when the walk reaches the target's next sibling
+                record[field_name] = rule.get('default')
+                waiting_fields.append((field_name, rule))
+                continue
+
+            excluded = chosen_elements.get(rule.get('distinct_from'))
+            chosen = None
+            for element, enclosing_link in self.candidates[rule['tag']]:
+                # Compared with == like the original scripts did
+                is_within_link = enclosing_link == link
+                if 'within' in rule and not is_within_link:
+                    continue
+                if 'not_within' in rule and is_within_link:
+                    continue
+                if excluded is not None and element == excluded:
+                    continue
+                chosen = element
+                break
+            chosen_elements[field_name] = chosen
+            record[field_name] = spec.apply_rejections(rule, chosen.get_text().strip() if chosen is not None else None)
+
+        record['source'] = spec.name
+        return record, waiting_fields
+
+
+class SpecMatcher:
+
+    def __init__(self, specs):
+        self.specs = [CompiledSpec(spec) for spec in specs]
+
+    def extract(self, soup, url=None):
+        # Walks the document once and returns {spec name: [records]} for the specs that apply to url.
+        # Targets, links, field candidates and next siblings are all picked up during the walk.
+        active_specs = [spec for spec in self.specs if spec.applies_to(url)]
+        results = {spec.name: [] for spec in active_specs}
+
+        # Group the active specs by target tag so each element only checks the relevant specs
+        specs_by_tag = {}
+        for spec in active_specs:
+            specs_by_tag.setdefault(spec.target_tag, []).append(spec)
+
+        open_targets = []
+        # spec name -> {field name: text of the last heading seen for it}
+        headings = {spec.name: {} for spec in active_specs}
+        # (parent, spec, record, field name, rule) waiting for the target's next sibling element
+        waiting_siblings = []
+
+        def resolve_siblings(parent, sibling):
+            for waiting in [waiting for waiting in waiting_siblings if waiting[0] is parent]:
+                waiting_siblings.remove(waiting)
+                _, spec, record, field_name, rule = waiting
+                value = None
+                if sibling is not None and spec.is_target(sibling):
+                    value = sibling.get_text().strip()
+                record[field_name] = spec.apply_rejections(rule, value)
+
+        def enter(element):
+            if waiting_siblings:
+                # The first element entered under the same parent is the next sibling
+                resolve_siblings(element.parent, element)
+            for state in open_targets:
+                state.enter(element)
+            for spec in active_specs:
+                for field_name in spec.heading_fields.get(element.name, ()):
+                    headings[spec.name][field_name] = element.get_text().strip()
+            for spec in specs_by_tag.get(element.name, ()):
+                if spec.is_target(element):
+                    records = results[spec.name]
+                    open_targets.append(TargetState(spec, element, len(records), dict(headings[spec.name])))
+                    records.append(None)
+
+        def exit(element):
+            for state in [state for state in open_targets if state.element is element]:
+                open_targets.remove(state)
+                record, waiting_fields = state.finish()
+                results[state.spec.name][state.slot] = record
+                for field_name, rule in waiting_fields:
+                    waiting_siblings.append((element.parent, state.spec, record, field_name, rule))
+            for state in open_targets:
+                state.exit(element)
+            if waiting_siblings:
+                # No further sibling for targets that were the last child of this element
+                resolve_siblings(element, None)
+
+        # Iterative depth-first walk with enter/exit events
+        stack = [(soup, iter(soup.contents))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if node is not soup:
+                    exit(node)
+            elif isinstance(child, Tag):
+                enter(child)
+                stack.append((child, iter(child.contents)))
+        resolve_siblings(soup, None)
+
+        # Targets that were not project entries left an empty slot
+        return {name: [record for record in records if record is not None] for name, records in results.items()}
+
+
+def print_records(records, spec):
+    # Same layout as scrape5.py, so the output can be compared with data5.txt
+    if records:
+        print(f"Found {len(records)} project entries.")
+        for i, project in enumerate(records):
+            print(f"\n--- Project {i+1} ---")
+            print(f"URL: {project.get('url', 'No URL Found')}")
+            for type_name, _, label in spec.url_types:
+                print(f"Is {label} URL: {project.get(f'is_{type_name}_url', False)}")
+            print(f"Title: {project.get('title', 'No Title Found')}")
+            print(f"Award: {project.get('award', 'No Award Found')}")
+            print(f"Summary: {project.get('summary', 'No Summary Found')}")
+            print("-" * 30)
+
+    else:
+        print("No project entries found based on the criteria.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scrape every registered site using its extraction spec.')
+    parser.add_argument('--specs', default=default_specs_directory, help='Directory of spec JSON files')
+    parser.add_argument('--site', action='append', help='Only scrape the named spec(s)')
+    parser.add_argument('--html', help='Parse a saved HTML file instead of fetching (applies to all selected specs)')
+    args = parser.parse_args()
+
+    specs = [spec for spec in load_specs(args.specs) if not args.site or spec['name'] in args.site]
+    matcher = SpecMatcher(specs)
+
+    try:
+        if args.html:
+            with open(args.html, 'rb') as f:
+                pages = {None: f.read()}
+        else:
+            # Fetch each distinct URL once, even if several specs describe it
+            pages = {}
+            for spec in matcher.specs:
+                if spec.url and spec.url not in pages:
+                    response = requests.get(spec.url)
+                    response.raise_for_status()
+                    pages[spec.url] = response.content
+
+        compiled_by_name = {spec.name: spec for spec in matcher.specs}
+        for page_url, content in pages.items():
+            soup = BeautifulSoup(content, 'html.parser')
+            for spec_name, records in matcher.extract(soup, page_url).items():
+                if len(pages) > 1 or len(matcher.specs) > 1:
+                    print(f"\n=== {spec_name} ({page_url}) ===")
+                print_records(records, compiled_by_name[spec_name])
+
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching the page: {e}")
+    except Exception as e:
+        print(f"An error occurred during parsing or processing: {e}")
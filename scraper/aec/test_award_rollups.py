@@ -0,0 +1,64 @@
+import os
+
+from award_rollups import AwardRollups, normalize_award
+from record_store import load_records
+
+
+def test_normalize_award_combined_and_placeholder_awards():
+    assert normalize_award('BEST COLLABORATION/OPEN SOURCE: Slackit') == ('BEST_COLLABORATION', 'BEST_OPEN_SOURCE')
+    assert normalize_award('Best Breakout Team & Hacker’s Choice') == ('BEST_BREAKOUT_TEAM', 'HACKERS_CHOICE')
+    assert normalize_award('No Award Found') == ('NO_AWARD',)
+    assert normalize_award('SPECIAL JURY PRIZE:') == ('OTHER',)
+
+
+def test_re_extracted_records_replace_their_earlier_counts():
+    records = [
+        {'url': 'https://github.com/a', 'title': 'A', 'award': 'BEST OVERALL HACK:', 'summary': 'Rhino plugin'},
+        {'url': 'https://github.com/b', 'title': 'B', 'award': 'No Award Found', 'summary': 'Revit tool'},
+    ]
+    rollups = AwardRollups()
+    rollups.add_many(records)
+    rollups.add_many(records)
+    assert rollups.total_records == 2
+    assert rollups.category_count('BEST_OVERALL') == 1
+    assert rollups.keyword_win_count('Rhino') == 1
+
+    # The same project re-scraped with a different award moves to the new category
+    rollups.add(dict(records[0], award='BEST OPEN SOURCE HACK:'))
+    assert rollups.category_count('BEST_OVERALL') == 0
+    assert rollups.category_count('BEST_OPEN_SOURCE') == 1
+    assert rollups.total_winners == 1
+
+    assert rollups.remove(records[1])
+    assert not rollups.remove(records[1])
+    assert rollups.total_records == 1
+    assert rollups.keyword_count('Revit', 'NO_AWARD') == 0
+
+
+def test_saved_rollups_stay_idempotent_after_loading():
+    record = {'url': 'https://github.com/a', 'title': 'A', 'award': 'BEST OVERALL HACK:'}
+    rollups = AwardRollups()
+    rollups.add(record)
+    loaded = AwardRollups.from_dict(rollups.to_dict())
+    loaded.add(record)
+    assert loaded.to_dict() == rollups.to_dict()
+
+
+def test_records_without_a_url_are_all_counted():
+    # data4.txt has 49 projects without a GitHub URL, most with a placeholder title
+    rollups = AwardRollups()
+    rollups.add_many(load_records(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data4.txt')))
+    assert rollups.total_records == 135
+    assert rollups.unkeyed_count == 49
+
+
+def test_awards_are_counted_per_event():
+    rollups = AwardRollups()
+    rollups.add_many([
+        {'url': 'https://github.com/a', 'award': 'BEST OVERALL HACK:', 'event': '2023 NYC'},
+        {'url': 'https://github.com/b', 'award': 'BEST OVERALL HACK:', 'event': '2022 NYC'},
+        {'url': 'https://github.com/c', 'award': 'No Award Found'},
+    ])
+    assert rollups.event_count('2023 NYC', 'BEST_OVERALL') == 1
+    assert rollups.event_count('2022 NYC', 'BEST_OVERALL') == 1
+    assert rollups.event_count('Unknown Event', 'NO_AWARD') == 1
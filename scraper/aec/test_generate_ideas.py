@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+
+from award_rollups import AwardRollups
+from generate_ideas import HttpBackend, IdeaGenerator, PromptCache, build_prompt, cache_key, start_stub_server, stub_response
+
+records = [
+    {'url': 'https://github.com/a', 'title': 'Zoning Bot', 'award': 'BEST OVERALL HACK:', 'summary': 'AI zoning checks in Rhino'},
+    {'url': 'https://github.com/b', 'title': 'Carbon Lens', 'award': 'No Award Found', 'summary': 'Embodied carbon for structural models'},
+    {'url': 'https://github.com/c', 'title': 'Graph Hop', 'award': 'BEST COLLABORATIVE HACK:', 'summary': 'Grasshopper files in a graph database'},
+]
+
+
+class RecordingBackend(HttpBackend):
+    # HttpBackend that remembers the size of every batch it sends
+
+    def __init__(self, url):
+        super().__init__(url)
+        self.lock = threading.Lock()
+        self.batch_sizes = []
+
+    def generate_batch(self, prompts):
+        with self.lock:
+            self.batch_sizes.append(len(prompts))
+        return super().generate_batch(prompts)
+
+
+@pytest.fixture
+def stub_server():
+    prompts_seen = []
+
+    def respond(prompt):
+        prompts_seen.append(prompt)
+        return stub_response(prompt)
+
+    server = start_stub_server(respond=respond)
+    server.prompts_seen = prompts_seen
+    yield server
+    server.shutdown()
+
+
+def make_generator(stub_server, cache, batch_size=2, corpus=records):
+    backend = RecordingBackend(f"http://127.0.0.1:{stub_server.server_address[1]}/generate")
+    rollups = AwardRollups()
+    rollups.add_many(corpus)
+    return IdeaGenerator(corpus, backend, cache, rollups, batch_size=batch_size, max_concurrency=2)
+
+
+def test_prompts_are_batched_and_reworded_themes_generated_once(stub_server, tmp_path):
+    cache = PromptCache(str(tmp_path / 'cache.sqlite3'))
+    generator = make_generator(stub_server, cache)
+
+    themes = ['AI zoning', 'zoning AI', 'embodied carbon', 'graph database', 'rhino']
+    results = generator.generate(themes)
+
+    assert set(results) == set(themes)
+    assert results['AI zoning'] == results['zoning AI']
+    # Four distinct themes, sent as batches of at most two prompts
+    assert len(stub_server.prompts_seen) == 4
+    assert sorted(generator.backend.batch_sizes) == [2, 2]
+    assert generator.cache_misses == 4
+    cache.close()
+
+
+def test_cached_responses_survive_restarts_and_new_records(stub_server, tmp_path):
+    cache_path = str(tmp_path / 'cache.sqlite3')
+    cache = PromptCache(cache_path)
+    make_generator(stub_server, cache).generate(['AI zoning'])
+    cache.close()
+
+    # A new, unrelated record does not change the key of a theme whose retrieved projects are the same
+    corpus = records + [{'url': 'https://github.com/d', 'title': 'Crane Planner', 'award': 'No Award Found', 'summary': 'Site logistics'}]
+    cache = PromptCache(cache_path)
+    generator = make_generator(stub_server, cache, corpus=corpus)
+    generator.generate(['zoning ai'])
+
+    assert generator.cache_hits == 1
+    assert generator.cache_misses == 0
+    assert len(stub_server.prompts_seen) == 1
+    cache.close()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = PromptCache(str(tmp_path / 'cache.sqlite3'), max_entries=2)
+    cache.put_many([('a', '1')])
+    cache.put_many([('b', '2')])
+    assert cache.get('a') == '1'
+    cache.put_many([('c', '3')])
+
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a') == '1'
+    cache.close()
+
+
+def test_cache_keys_depend_on_backend_and_prompt_format():
+    projects = records[:1]
+    key = cache_key('AI zoning', projects, 'stub')
+    assert cache_key('zoning AI', projects, 'stub') == key
+    assert cache_key('AI zoning', projects, 'http://gpu-box:8000/generate') != key
+    assert cache_key('AI zoning', projects, 'stub', prompt_version=0) != key
+
+
+def test_prompt_stats_use_keyword_aliases():
+    corpus = records + [{'url': 'https://github.com/e', 'title': 'Spec Writer', 'award': 'BEST OVERALL HACK:', 'summary': 'LLM spec drafting'}]
+    rollups = AwardRollups()
+    rollups.add_many(corpus)
+    # "gpt" reports under LLM, "vr" under VR/AR
+    assert 'Projects mentioning LLM won 1 awards.' in build_prompt('GPT assistant', [], rollups)
+    rollups.add({'url': 'https://github.com/f', 'title': 'Site Walk', 'award': 'BEST OVERALL HACK:', 'summary': 'VR site tours'})
+    assert 'Projects mentioning VR/AR won 1 awards.' in build_prompt('vr for construction', [], rollups)
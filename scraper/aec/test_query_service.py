@@ -0,0 +1,50 @@
+import json
+
+from query_service import CorpusIndex, QueryService
+
+records = [
+    {'url': 'https://github.com/a', 'is_github_url': True, 'title': 'Zoning Bot', 'award': 'BEST OVERALL HACK:', 'summary': 'AI zoning checks'},
+    {'url': 'https://devpost.com/software/b', 'is_devpost_url': True, 'title': 'Carbon Lens', 'award': 'SPECIAL JURY PRIZE:', 'summary': 'Embodied carbon'},
+    {'url': 'https://github.com/c', 'is_github_url': True, 'title': 'Graph Hop', 'award': 'No Award Found', 'summary': 'Zoning graphs'},
+]
+
+
+def make_service():
+    service = QueryService([])
+    service.index = CorpusIndex(records)
+    return service
+
+
+def test_award_accepts_categories_and_raw_award_text():
+    index = CorpusIndex(records)
+    assert index.query(award='BEST_OVERALL') == [0]
+    assert index.query(award='best overall hack:') == [0]
+    assert index.query(award='OTHER') == [1]
+    # Known category without any records does not fall back to OTHER
+    assert index.query(award='HACKERS_CHOICE') == []
+    assert index.query(award='NO_AWARD', words=['zoning']) == [2]
+
+
+def test_search_and_paging():
+    service = make_service()
+    status, body = service.handle('/search?q=zoning&limit=1&offset=1')
+    assert status == 200
+    result = json.loads(body)
+    assert result['total'] == 2
+    assert [project['title'] for project in result['projects']] == ['Graph Hop']
+
+
+def test_negative_limit_or_offset_is_rejected():
+    service = make_service()
+    assert service.handle('/projects?limit=-1')[0] == 400
+    assert service.handle('/projects?offset=-5')[0] == 400
+    assert service.handle('/projects?limit=abc')[0] == 400
+
+
+def test_equivalent_queries_share_a_cache_entry():
+    service = make_service()
+    first = service.handle('/projects?award=best_overall&host=www.GitHub.com')
+    assert service.handle('/projects?host=github.com&award=BEST%20OVERALL%20HACK:') == first
+    assert service.handle('/search?q=Zoning') == service.handle('/search?q=zoning')
+    assert len(service.cache.entries) == 2
+    assert service.cache.hits == 2
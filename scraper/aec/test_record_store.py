@@ -0,0 +1,76 @@
+import glob
+import os
+
+import pytest
+
+from record_store import RecordFile, load_records, write_records
+from scrape_output import load_output
+
+script_directory = os.path.dirname(os.path.abspath(__file__))
+data_files = sorted(glob.glob(os.path.join(script_directory, 'data*.txt')))
+
+
+@pytest.mark.parametrize('data_file', data_files, ids=os.path.basename)
+def test_scrape_outputs_round_trip(data_file, tmp_path):
+    records = load_output(data_file)
+    path = str(tmp_path / 'records.rec')
+    write_records(path, records)
+
+    with load_records(path) as record_file:
+        assert len(record_file) == len(records)
+        assert [record.to_dict() for record in record_file] == records
+
+
+def test_indexing_missing_fields_and_filter(tmp_path):
+    records = [
+        {'url': 'https://github.com/a', 'is_github_url': True, 'title': 'A', 'summary': None},
+        {'url': 'https://devpost.com/b', 'is_github_url': False, 'paragraphs': ['one', 'two']},
+        {'url': 'https://github.com/c', 'is_github_url': True, 'title': 'Ç'},
+    ]
+    path = str(tmp_path / 'records.rec')
+    write_records(path, records)
+
+    with RecordFile(path) as record_file:
+        assert record_file[-1]['title'] == 'Ç'
+        assert record_file[-3]['url'] == 'https://github.com/a'
+        with pytest.raises(IndexError):
+            record_file[3]
+        with pytest.raises(IndexError):
+            record_file[-4]
+
+        # A field stored as None is present; a field the record never had is missing
+        first, second = record_file[0], record_file[1]
+        assert 'summary' in first and first['summary'] is None
+        assert 'title' not in second
+        with pytest.raises(KeyError):
+            second['title']
+        assert second.get('title', 'No Title Found') == 'No Title Found'
+        assert second['paragraphs'] == ['one', 'two']
+        with pytest.raises(KeyError):
+            first['award']
+
+        assert [record['url'] for record in record_file.filter('is_github_url')] == ['https://github.com/a', 'https://github.com/c']
+        assert list(record_file.field_values('title')) == ['A', None, 'Ç']
+
+
+def test_empty_record_file(tmp_path):
+    path = str(tmp_path / 'records.rec')
+    write_records(path, [])
+
+    with RecordFile(path) as record_file:
+        assert len(record_file) == 0
+        assert list(record_file) == []
+        with pytest.raises(IndexError):
+            record_file[0]
+
+
+def test_close_while_field_values_are_still_referenced(tmp_path):
+    path = str(tmp_path / 'records.rec')
+    write_records(path, [{'title': 'A'}])
+
+    record_file = RecordFile(path)
+    view = record_file[0]
+    encoded = view.field_bytes(0)
+    record_file.close()
+    assert record_file.file.closed
+    assert encoded[1:] == b'A'
@@ -0,0 +1,148 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from refresh_scheduler import FetchBudget, RefreshScheduler, polls_per_change_interval
+
+initial_interval = 3600
+
+
+@pytest.fixture
+def page_server():
+    # Serves page['body'] with an ETag and answers 304 when the client already has it
+    page = {'body': b'<p>one</p>', 'etag': '"1"', 'requests': 0, 'paths': []}
+
+    class PageHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            page['requests'] += 1
+            page['paths'].append(self.path)
+            if self.headers.get('If-None-Match') == page['etag']:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('ETag', page['etag'])
+            self.send_header('Content-Length', str(len(page['body'])))
+            self.end_headers()
+            self.wfile.write(page['body'])
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.page = page
+    server.url = f'http://127.0.0.1:{server.server_address[1]}/archive'
+    yield server
+    server.shutdown()
+
+
+def make_scheduler(url, changes, fail=None):
+    def on_change(changed_url, extracted):
+        if fail and fail[0]:
+            raise RuntimeError('disk full')
+        changes.append(extracted)
+
+    # Extracts the text between the tags, so markup-only edits are not changes
+    def extract(changed_url, content):
+        return content.decode('utf-8').replace('<p>', '').replace('</p>', '').split()
+
+    return RefreshScheduler([url], on_change, min_interval=1, initial_interval=initial_interval, extract=extract)
+
+
+def test_first_fetch_is_a_baseline_and_later_changes_are_counted(page_server):
+    changes = []
+    scheduler = make_scheduler(page_server.url, changes)
+    state = scheduler.sources[page_server.url]
+
+    scheduler.poll(state)
+    assert changes == [['one']]
+    assert state.change_count == 0 and state.last_changed is None
+    assert state.interval == initial_interval
+
+    # Unchanged: answered 304 thanks to the stored ETag
+    scheduler.poll(state)
+    assert state.change_count == 0
+    assert state.interval > initial_interval
+
+    # New markup, same records: not a change
+    page_server.page.update(body=b'<p>one</p>\n', etag='"2"')
+    scheduler.poll(state)
+    assert state.change_count == 0 and state.etag == '"2"'
+
+    page_server.page.update(body=b'<p>one two</p>', etag='"3"')
+    interval = state.interval
+    scheduler.poll(state)
+    assert changes == [['one'], ['one', 'two']]
+    assert state.change_count == 1 and state.last_changed is not None
+    assert state.interval == interval / polls_per_change_interval
+
+
+def test_failed_on_change_is_retried_on_the_next_poll(page_server):
+    changes = []
+    fail = [True]
+    scheduler = make_scheduler(page_server.url, changes, fail)
+    state = scheduler.sources[page_server.url]
+
+    with pytest.raises(RuntimeError):
+        scheduler.poll(state)
+    assert state.content_hash is None and state.etag is None
+
+    fail[0] = False
+    scheduler.poll(state)
+    assert changes == [['one']]
+
+
+def test_forget_re_extracts_an_unchanged_page(page_server):
+    changes = []
+    scheduler = make_scheduler(page_server.url, changes)
+    state = scheduler.sources[page_server.url]
+    scheduler.poll(state)
+
+    scheduler.forget(page_server.url)
+    scheduler.poll(state)
+    assert changes == [['one'], ['one']]
+    assert page_server.page['requests'] == 2
+
+
+def test_run_returns_without_sources():
+    scheduler = RefreshScheduler([], lambda url, extracted: None)
+    scheduler.run()
+
+
+def test_run_polls_in_due_order_within_the_fetch_budget(page_server):
+    base_url = page_server.url.rsplit('/', 1)[0]
+    urls = [f'{base_url}/a', f'{base_url}/b', f'{base_url}/c']
+    # Two fetches up front, then one every half hour
+    scheduler = RefreshScheduler(urls, lambda url, extracted: None, max_fetches_per_hour=2, initial_interval=initial_interval)
+    now = time.time()
+    for url, due_in in zip(urls, [-2, -1, -3]):
+        scheduler.sources[url].next_due = now + due_in
+    scheduler.queue = sorted((state.next_due, url) for url, state in scheduler.sources.items())
+
+    thread = threading.Thread(target=scheduler.run)
+    thread.start()
+    try:
+        deadline = time.time() + 5
+        while len(page_server.page['paths']) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        # Give the loop time to fetch a third page if the budget did not hold it back
+        time.sleep(0.2)
+        queue_state = scheduler.queue_state()
+    finally:
+        scheduler.stop()
+        thread.join(timeout=5)
+
+    assert page_server.page['paths'] == ['/c', '/a']
+    assert queue_state['budget_tokens'] < 1
+    # The throttled source is still first in line
+    assert [source['url'] for source in queue_state['sources']] == [urls[1], urls[2], urls[0]]
+    assert queue_state['sources'][0]['fetch_count'] == 0
+
+
+def test_fetch_budget_must_be_positive():
+    with pytest.raises(ValueError):
+        FetchBudget(0)
@@ -0,0 +1,18 @@
+import pytest
+
+from regression_harness import check_strategy, default_fixtures_directory, diff_records, strategies
+
+
+@pytest.mark.parametrize('name, script, arguments, golden_file', strategies, ids=[strategy[0] for strategy in strategies])
+def test_strategy_matches_its_golden_output(name, script, arguments, golden_file):
+    result = check_strategy(name, script, arguments, golden_file, default_fixtures_directory, repeat=1)
+    assert result['differences'] == []
+
+
+def test_diff_reports_changed_fields_and_missing_records():
+    golden = [{'url': 'https://github.com/a', 'title': 'A'}, {'url': 'https://github.com/b', 'title': 'B'}]
+    actual = [{'url': 'https://github.com/a', 'title': 'A2'}]
+    assert diff_records(actual, golden) == [
+        "record 1 title: expected 'A', got 'A2'",
+        "missing record 2: 'https://github.com/b'",
+    ]
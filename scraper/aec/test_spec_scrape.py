@@ -0,0 +1,78 @@
+import os
+import runpy
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+from scrape_output import parse_output
+from spec_scrape import SpecMatcher, load_specs
+
+script_directory = os.path.dirname(os.path.abspath(__file__))
+
+style = 'white-space:pre-wrap;'
+# Small archive page covering the layouts scrape5.py has to deal with
+page = f'''<html><body><div>
+<p style="{style}">Intro <a href="https://example.com">not a project</a></p>
+<h3><strong>2023 EVENT</strong></h3>
+<p style="{style}"><strong>BEST OVERALL HACK:</strong> <a href="https://github.com/a/b"><strong>Snail</strong></a></p>
+<p style="{style}">"Realtime" AI for Rhino</p>
+<p style="{style}">Team: Bob</p>
+<p style="{style}"><a href="https://devpost.com/x"><strong>Dup</strong></a> <strong>Dup</strong></p>
+<p style="{style}">Team Alice</p>
+<p style="{style}"><a href="https://GitHub.com/c"><em>no strong</em></a></p>
+<div>break</div><p style="{style}">orphan</p>
+<p style="{style}"><strong>BEST OPEN SOURCE:</strong> <a href="https://github.com/d"><strong>Stroll</strong></a><strong>x</strong></p><p style="other">no</p>
+</div>
+<h2>2022 Hackathon</h2>
+<p style="{style}"><a href="https://github.com/e"><strong>Last</strong></a></p>
+</body></html>'''
+
+
+def extract(html):
+    return SpecMatcher(load_specs()).extract(BeautifulSoup(html, 'html.parser'))['aectech']
+
+
+def test_spec_extracts_awards_titles_and_summaries():
+    records = extract(page)
+    assert [(r['url'], r['title'], r['award'], r['summary']) for r in records] == [
+        ('https://github.com/a/b', 'Snail', 'BEST OVERALL HACK:', '"Realtime" AI for Rhino'),
+        # The strong outside the link equals the title, so it is not taken as the award
+        ('https://devpost.com/x', 'Dup', 'No Award Found', 'No Summary Found'),
+        ('https://GitHub.com/c', 'No Title Found', 'No Award Found', 'No Summary Found'),
+        ('https://github.com/d', 'Stroll', 'BEST OPEN SOURCE:', 'No Summary Found'),
+        ('https://github.com/e', 'Last', 'No Award Found', 'No Summary Found'),
+    ]
+    assert records[1]['is_devpost_url'] and not records[1]['is_github_url']
+    # Each record carries the last section heading before it
+    assert [r['event'] for r in records] == ['2023 EVENT'] * 4 + ['2022 Hackathon']
+
+
+def test_spec_matches_scrape5_output(monkeypatch, capsys):
+    class PageResponse:
+        content = page.encode('utf-8')
+
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(requests, 'get', lambda url: PageResponse())
+    runpy.run_path(os.path.join(script_directory, 'scrape5.py'), run_name='__main__')
+    scrape5_records = parse_output(capsys.readouterr().out)
+
+    spec_records = [{key: value for key, value in record.items() if key not in ('source', 'event')} for record in extract(page)]
+    assert spec_records == scrape5_records
+
+
+@pytest.mark.parametrize('rule, message', [
+    ({'tag': 'strong', 'within': 'anchor'}, "'within' must be one of"),
+    ({'tag': 'strong', 'within': 'link', 'not_within': 'link'}, 'not both'),
+    ({'tag': 'strong', 'distinct_from': 'summary'}, 'earlier tag field'),
+    ({'tag': 'strong', 'inside': 'link'}, 'unknown keys'),
+    ({'from': 'previous_sibling'}, "needs a 'tag'"),
+    ({'from': 'previous_heading'}, "non-empty 'tags' list"),
+])
+def test_invalid_field_rules_are_rejected(rule, message):
+    spec = load_specs()[0]
+    spec['fields'] = dict(spec['fields'], extra=rule)
+    with pytest.raises(ValueError, match=message):
+        SpecMatcher([spec])